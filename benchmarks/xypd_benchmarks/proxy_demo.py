@@ -18,6 +18,7 @@ import logging
 import os
 import sys
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from typing import Callable, Optional
 
 import aiohttp
@@ -60,6 +61,7 @@ class Proxy:
         self.scheduling_policy = scheduling_policy
         self.custom_create_completion = custom_create_completion
         self.custom_create_chat_completion = custom_create_chat_completion
+        self.session: Optional[aiohttp.ClientSession] = None
         self.router = APIRouter()
         self.setup_routes()
 
@@ -192,46 +194,61 @@ class Proxy:
             logger.error("Error in add_instance_endpoint: %s", str(e))
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    def get_session(self) -> aiohttp.ClientSession:
+        # Share one keep-alive pool across requests so prefill/decode calls
+        # do not pay a TCP handshake each; limit=0 lifts aiohttp's default
+        # cap of 100 connections, which would throttle high concurrency.
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=0,
+                                             keepalive_timeout=600)
+            self.session = aiohttp.ClientSession(timeout=AIOHTTP_TIMEOUT,
+                                                 connector=connector)
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
     async def forward_request(self, url, data, use_chunked=True):
-        async with aiohttp.ClientSession(timeout=AIOHTTP_TIMEOUT) as session:
-            headers = {
-                "Authorization": f"Bearer {os.environ.get('OPENAI_API_KEY')}"
-            }
-            try:
-                async with session.post(url=url, json=data,
-                                        headers=headers) as response:
-                    if 200 <= response.status < 300 or 400 <= response.status < 500:  # noqa: E501
-                        if use_chunked:
-                            async for chunk_bytes in response.content.iter_chunked(  # noqa: E501
-                                    1024):
-                                yield chunk_bytes
-                        else:
-                            content = await response.read()
-                            yield content
+        session = self.get_session()
+        headers = {
+            "Authorization": f"Bearer {os.environ.get('OPENAI_API_KEY')}"
+        }
+        try:
+            async with session.post(url=url, json=data,
+                                    headers=headers) as response:
+                if 200 <= response.status < 300 or 400 <= response.status < 500:  # noqa: E501
+                    if use_chunked:
+                        async for chunk_bytes in response.content.iter_chunked(  # noqa: E501
+                                1024):
+                            yield chunk_bytes
                     else:
-                        error_content = await response.text()
-                        try:
-                            error_content = json.loads(error_content)
-                        except json.JSONDecodeError:
-                            error_content = error_content
-                        logger.error("Request failed with status %s: %s",
-                                     response.status, error_content)
-                        raise HTTPException(
-                            status_code=response.status,
-                            detail=
-                            f"Request failed with status {response.status}: "
-                            f"{error_content}",
-                        )
-            except aiohttp.ClientError as e:
-                logger.error("ClientError occurred: %s", str(e))
-                raise HTTPException(
-                    status_code=502,
-                    detail=
-                    "Bad Gateway: Error communicating with upstream server.",
-                ) from e
-            except Exception as e:
-                logger.error("Unexpected error: %s", str(e))
-                raise HTTPException(status_code=500, detail=str(e)) from e
+                        content = await response.read()
+                        yield content
+                else:
+                    error_content = await response.text()
+                    try:
+                        error_content = json.loads(error_content)
+                    except json.JSONDecodeError:
+                        error_content = error_content
+                    logger.error("Request failed with status %s: %s",
+                                 response.status, error_content)
+                    raise HTTPException(
+                        status_code=response.status,
+                        detail=
+                        f"Request failed with status {response.status}: "
+                        f"{error_content}",
+                    )
+        except aiohttp.ClientError as e:
+            logger.error("ClientError occurred: %s", str(e))
+            raise HTTPException(
+                status_code=502,
+                detail=
+                "Bad Gateway: Error communicating with upstream server.",
+            ) from e
+        except Exception as e:
+            logger.error("Unexpected error: %s", str(e))
+            raise HTTPException(status_code=500, detail=str(e)) from e
 
     def schedule(self, cycler: itertools.cycle) -> str:
         return self.scheduling_policy.schedule(cycler)
@@ -404,7 +421,13 @@ class ProxyServer:
                     f"Error communicating with {instance}: {str(e)}") from e
 
     def run_server(self):
-        app = FastAPI()
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            yield
+            await self.proxy_instance.close()
+
+        app = FastAPI(lifespan=lifespan)
         app.include_router(self.proxy_instance.router)
         config = uvicorn.Config(app, port=self.port, loop="uvloop")
         server = uvicorn.Server(config)
@@ -14,6 +14,10 @@ MASTER_PORT=${MASTER_PORT:-"10001"}
 PREFILL_PORT_BASE=${PREFILL_PORT_BASE:-"8100"}
 DECODE_PORT_BASE=${DECODE_PORT_BASE:-"8200"}
 PROXY_PORT=${PROXY_PORT:-"8000"}
+# CPU list for the benchmark client, e.g. "16-19". When the client shares a
+# host with the vLLM instances, pin it to CPUs disjoint from theirs so its
+# work does not skew the measured TTFT/TPOT.
+CLIENT_CPUS=${CLIENT_CPUS:-""}
 logs_root=${LOG_ROOT:-"logs"}
 results_root=${RESULT_ROOT:-"results"}
 
@@ -169,6 +173,7 @@ benchmark() {
         input_len_name=$(printf %04d $input_len)
         output_len_name=$(printf %04d $output_len)
         max_concurrency_name=$(printf %03d $max_concurrency)
+        ${CLIENT_CPUS:+taskset -c $CLIENT_CPUS} \
         python3 $VLLM_SRC_PATH/benchmarks/benchmark_serving.py \
               --backend vllm \
               --model ${MODEL} \
@@ -183,6 +188,7 @@ benchmark() {
               --port ${PROXY_PORT} \
               --save-result \
               --percentile-metrics="ttft,tpot,itl,e2el" \
+              --metric-percentiles="90,95,99" \
               --result-dir=${results_root} \
               --result-filename=${file_prefix}-input-${input_len_name}-output-${output_len_name}-concurrency-${max_concurrency_name}-serving.json \
               2>&1 | tee ${logs_root}/${file_prefix}-${input_len_name}-output-${output_len_name}-concurrency-${max_concurrency_name}-serving.txt
@@ -5,18 +5,22 @@ import openpyxl
 
 global metrics
 metrics = ['request_throughput', 'output_throughput', 'total_token_throughput',\
-            'mean_ttft_ms', 'median_ttft_ms', 'std_ttft_ms', 'p99_ttft_ms',\
-            'mean_tpot_ms', 'median_tpot_ms', 'std_tpot_ms', 'p99_tpot_ms',\
-            'mean_itl_ms', 'median_itl_ms', 'std_itl_ms', 'p99_itl_ms', \
-            'mean_e2el_ms', 'median_e2el_ms', 'std_e2el_ms', 'p99_e2el_ms' ]
+            'mean_ttft_ms', 'median_ttft_ms', 'std_ttft_ms',\
+            'p90_ttft_ms', 'p95_ttft_ms', 'p99_ttft_ms',\
+            'mean_tpot_ms', 'median_tpot_ms', 'std_tpot_ms',\
+            'p90_tpot_ms', 'p95_tpot_ms', 'p99_tpot_ms',\
+            'mean_itl_ms', 'median_itl_ms', 'std_itl_ms', \
+            'p90_itl_ms', 'p95_itl_ms', 'p99_itl_ms', \
+            'mean_e2el_ms', 'median_e2el_ms', 'std_e2el_ms',\
+            'p90_e2el_ms', 'p95_e2el_ms', 'p99_e2el_ms' ]
 
 def parse_serving_throughput(path: str):
     values=[]
-    with open(path, 'r') as f:
-        result = json.load(f)
-        for metric in metrics:
-            value = result[metric]
-            values.append(value)
+    with open(path, 'rb') as f:
+        result = json.loads(f.read())
+    for metric in metrics:
+        value = result[metric]
+        values.append(value)
     return values
             
 